@@ -0,0 +1,31 @@
+"""add indexes for moderation stats queries
+
+Revision ID: add_moderation_stats_indexes
+Revises: add_title_to_media
+Create Date: 2025-12-03 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "add_moderation_stats_indexes"
+down_revision = "add_title_to_media"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_instagram_comments_created_at", "instagram_comments", ["created_at"])
+    op.create_index(
+        "ix_comments_classification_status_completed_type",
+        "comments_classification",
+        ["processing_status", "processing_completed_at", "type"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comments_classification_status_completed_type", table_name="comments_classification")
+    op.drop_index("ix_instagram_comments_created_at", table_name="instagram_comments")
@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import ForeignKey, String, Integer, Text, JSON, Enum as SQLEnum
+from sqlalchemy import ForeignKey, String, Integer, Text, JSON, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .base import Base
 
@@ -20,6 +20,15 @@ class ProcessingStatus(str, Enum):
 
 class CommentClassification(Base):
     __tablename__ = "comments_classification"
+    __table_args__ = (
+        # Covers the completed-in-range lookups (and type breakdown) in moderation stats
+        Index(
+            "ix_comments_classification_status_completed_type",
+            "processing_status",
+            "processing_completed_at",
+            "type",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     comment_id: Mapped[str] = mapped_column(
@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship, foreign
-from sqlalchemy import String, ForeignKey, Boolean, and_
+from sqlalchemy import String, ForeignKey, Boolean, Index, and_
 from sqlalchemy.dialects.postgresql import JSONB
 from .base import Base
 from .question_answer import QuestionAnswer
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 class InstagramComment(Base):
     __tablename__ = "instagram_comments"
+    __table_args__ = (
+        # Month-range filters in moderation stats
+        Index("ix_instagram_comments_created_at", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(primary_key=True)
     media_id: Mapped[str] = mapped_column(String(100), ForeignKey("media.id"), comment="Foreign key to media table")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -151,47 +152,47 @@ class GenerateStatsReportUseCase:
             "until": month_range.until,
         }
 
-        general_metrics = await self._call_insights(
-            account_id,
-            {
-                "metric": "views,likes,shares,comments,reach,saves,total_interactions",
-                "period": "day",
-                "breakdown": "media_product_type",
-                "metric_type": "total_value",
-                **timelines,
-            },
-        )
-
-        replies_metrics = await self._call_insights(
-            account_id,
-            {
-                "metric": "replies,accounts_engaged",
-                "period": "day",
-                "metric_type": "total_value",
-                **timelines,
-            },
-        )
-
-        profile_links_metrics = await self._call_insights(
-            account_id,
-            {
-                "metric": "profile_links_taps",
-                "period": "day",
-                "breakdown": "contact_button_type",
-                "metric_type": "total_value",
-                **timelines,
-            },
-        )
-
-        follow_type_metrics = await self._call_insights(
-            account_id,
-            {
-                "metric": "views,reach,follows_and_unfollows",
-                "period": "day",
-                "breakdown": "follow_type",
-                "metric_type": "total_value",
-                **timelines,
-            },
+        # The four insight queries are independent; issue them concurrently.
+        general_metrics, replies_metrics, profile_links_metrics, follow_type_metrics = await asyncio.gather(
+            self._call_insights(
+                account_id,
+                {
+                    "metric": "views,likes,shares,comments,reach,saves,total_interactions",
+                    "period": "day",
+                    "breakdown": "media_product_type",
+                    "metric_type": "total_value",
+                    **timelines,
+                },
+            ),
+            self._call_insights(
+                account_id,
+                {
+                    "metric": "replies,accounts_engaged",
+                    "period": "day",
+                    "metric_type": "total_value",
+                    **timelines,
+                },
+            ),
+            self._call_insights(
+                account_id,
+                {
+                    "metric": "profile_links_taps",
+                    "period": "day",
+                    "breakdown": "contact_button_type",
+                    "metric_type": "total_value",
+                    **timelines,
+                },
+            ),
+            self._call_insights(
+                account_id,
+                {
+                    "metric": "views,reach,follows_and_unfollows",
+                    "period": "day",
+                    "breakdown": "follow_type",
+                    "metric_type": "total_value",
+                    **timelines,
+                },
+            ),
         )
 
         return {
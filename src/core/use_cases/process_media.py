@@ -11,6 +11,10 @@ from ..interfaces.repositories import IMediaRepository
 
 logger = logging.getLogger(__name__)
 
+# Machine-readable reasons on MediaAnalysisResult, alongside "already_analyzed" etc.
+REASON_MEDIA_NOT_FOUND = "media_not_found"
+REASON_NO_RESULT = "analysis_returned_no_result"
+
 
 class ProcessMediaUseCase:
     """
@@ -146,7 +150,7 @@ class AnalyzeMediaUseCase:
 
             if not media:
                 logger.error(f"Media not found | media_id={media_id} | operation=analyze_media")
-                return MediaAnalysisResult(status="error", media_id=media_id, reason=f"Media {media_id} not found")
+                return MediaAnalysisResult(status="error", media_id=media_id, reason=REASON_MEDIA_NOT_FOUND)
 
             # 2. Check if already analyzed
             if media.media_context:
@@ -234,7 +238,7 @@ class AnalyzeMediaUseCase:
             return MediaAnalysisResult(
                 status="error",
                 media_id=media_id,
-                reason="Analysis failed - no result returned",
+                reason=REASON_NO_RESULT,
             )
         except Exception as exc:
             logger.exception(f"Unexpected error during media analysis | media_id={media_id}")
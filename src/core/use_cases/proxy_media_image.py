@@ -164,5 +164,4 @@ class ProxyMediaImageUseCase:
         return children[child_index]
 
     def _is_allowed_host(self, netloc: str) -> bool:
-        normalized = netloc.lower()
-        return any(normalized.endswith(suffix) for suffix in self.allowed_hosts)
+        return netloc.lower().endswith(self.allowed_hosts)
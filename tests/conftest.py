@@ -10,6 +10,7 @@ This file provides:
 """
 
 import asyncio
+import itertools
 import os
 import pytest
 import pytest_asyncio
@@ -31,13 +32,13 @@ os.environ.setdefault("OAUTH_ENCRYPTION_KEY", "1p_UUU0j5OJ9SxWwtUWFI7Ak4luuL8EA3
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
-from sqlalchemy import event, JSON
-from sqlalchemy.dialects import postgresql
+from sqlalchemy import event, insert, JSON
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 from faker import Faker
+from freezegun import freeze_time
 
 # Import your app modules
 from core.models.base import Base
@@ -60,15 +61,64 @@ from main import app
 fake = Faker()
 
 
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Layer markers derived from the directory a test lives in, so `-m unit` or
+# `-m use_case` select by path without per-class decorators.
+_PATH_MARKERS = {
+    "unit": "unit",
+    "integration": "integration",
+    "use_cases": "use_case",
+    "repositories": "repository",
+    "services": "service",
+    "agents": "agent",
+    "tasks": "task",
+    "models": "model",
+    "infrastructure": "infrastructure",
+}
+
+
+def pytest_collection_modifyitems(items):
+    """Apply path-based layer markers and run async tests on one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        rel_parts = os.path.relpath(str(item.path), TESTS_DIR).split(os.sep)[:-1]
+        for part in rel_parts:
+            marker = _PATH_MARKERS.get(part)
+            if marker and item.get_closest_marker(marker) is None:
+                item.add_marker(marker)
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the session loop on uvloop where available (installed via uvicorn[standard], absent on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_event_loop():
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture(autouse=True)
+def _restore_session_event_loop(_session_event_loop):
+    """Re-install the shared loop; sync tests (asyncio.run, Celery task helpers) may replace it."""
+    asyncio.set_event_loop(_session_event_loop)
+
+
 # ============================================================================
 # DATABASE FIXTURES
 # ============================================================================
 
 
-@pytest.fixture
-async def test_engine():
-    """Create an in-memory SQLite database engine for testing."""
-    # Use in-memory SQLite with asyncio support
+def _create_sqlite_engine(*, savepoints: bool = False):
+    """Create an in-memory SQLite engine whose single connection is shared via StaticPool."""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         connect_args={"check_same_thread": False},
@@ -76,33 +126,47 @@ async def test_engine():
         echo=False,
     )
 
-    # Register event listener to convert JSONB to JSON for SQLite compatibility
+    if not savepoints:
+        return engine
+
+    # pysqlite/aiosqlite issue their own BEGIN lazily, which breaks SAVEPOINT
+    # handling; let SQLAlchemy emit BEGIN so nested transactions work.
     @event.listens_for(engine.sync_engine, "connect")
-    def _set_sqlite_jsonb_compat(dbapi_conn, connection_record):
-        """Convert PostgreSQL JSONB columns to JSON for SQLite."""
-        # This runs on connect - SQLite will use JSON type instead of JSONB
-        pass
+    def _disable_driver_transactions(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
 
-    # Create all tables with JSONB→JSON conversion
-    async with engine.begin() as conn:
-        # Replace JSONB with JSON for SQLite before creating tables
-        def _create_tables_with_json(connection):
-            # Temporarily replace JSONB type with JSON for SQLite
-            from sqlalchemy.dialects import sqlite
 
-            # Save original JSONB type
-            original_type_map = postgresql.JSONB
+async def _create_schema(engine) -> None:
+    """Create all tables, converting PostgreSQL JSONB columns to JSON for SQLite."""
 
-            # Override JSONB to use JSON in SQLite
-            for table in Base.metadata.tables.values():
-                for column in table.columns:
-                    if hasattr(column.type, '__class__') and column.type.__class__.__name__ == 'JSONB':
-                        column.type = JSON()
+    def _create_tables_with_json(connection):
+        for table in Base.metadata.tables.values():
+            for column in table.columns:
+                if hasattr(column.type, '__class__') and column.type.__class__.__name__ == 'JSONB':
+                    column.type = JSON()
 
-            Base.metadata.create_all(connection)
+        Base.metadata.create_all(connection)
 
+    async with engine.begin() as conn:
         await conn.run_sync(_create_tables_with_json)
 
+
+@pytest.fixture
+async def test_engine():
+    """Create a fresh in-memory SQLite database engine for testing.
+
+    Integration tests commit through the application's own sessions, so they
+    get a brand new database per test.
+    """
+    engine = _create_sqlite_engine()
+    await _create_schema(engine)
+
     yield engine
 
     # Cleanup
@@ -112,18 +176,36 @@ async def test_engine():
     await engine.dispose()
 
 
-@pytest.fixture
-async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a database session for testing."""
-    async_session = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_engine():
+    """In-memory SQLite engine whose schema is created once per test session."""
+    engine = _create_sqlite_engine(savepoints=True)
+    await _create_schema(engine)
 
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(session_engine) -> AsyncGenerator[AsyncSession, None]:
+    """Create a database session for testing.
+
+    Each test runs inside an outer transaction that is rolled back on teardown;
+    ``commit()``/``rollback()`` inside the test only touch a SAVEPOINT.
+    """
+    async with session_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
 
 # ============================================================================
@@ -131,9 +213,16 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
 # ============================================================================
 
 
+_comment_ids = itertools.count(1)
+
+
 @pytest.fixture
 def instagram_comment_factory(db_session):
-    """Factory for creating test Instagram comments."""
+    """Factory for creating test Instagram comments.
+
+    Rows are written with a single ``INSERT ... RETURNING`` round-trip; the
+    per-test transaction in ``db_session`` discards them afterwards.
+    """
     async def _create_comment(
         comment_id: str = None,
         media_id: str = None,
@@ -144,22 +233,25 @@ def instagram_comment_factory(db_session):
         conversation_id: str = None,
         **kwargs
     ) -> InstagramComment:
-        comment = InstagramComment(
-            id=comment_id or fake.uuid4(),
-            media_id=media_id or fake.uuid4(),
-            user_id=user_id or fake.uuid4(),
-            username=username or fake.user_name(),
-            text=text or fake.sentence(),
-            created_at=kwargs.get("created_at", datetime.now(timezone.utc)),
-            raw_data=kwargs.get("raw_data", {}),
-            parent_id=parent_id,
-            conversation_id=conversation_id,
-            is_hidden=kwargs.get("is_hidden", False),
-            is_deleted=kwargs.get("is_deleted", False),
+        stmt = (
+            insert(InstagramComment)
+            .values(
+                id=comment_id or f"test_comment_{next(_comment_ids)}",
+                media_id=media_id or fake.uuid4(),
+                user_id=user_id or fake.uuid4(),
+                username=username or fake.user_name(),
+                text=text or fake.sentence(),
+                created_at=kwargs.get("created_at", datetime.now(timezone.utc)),
+                raw_data=kwargs.get("raw_data", {}),
+                parent_id=parent_id,
+                conversation_id=conversation_id,
+                is_hidden=kwargs.get("is_hidden", False),
+                is_deleted=kwargs.get("is_deleted", False),
+            )
+            .returning(InstagramComment)
         )
-        db_session.add(comment)
+        comment = (await db_session.execute(stmt)).scalar_one()
         await db_session.commit()
-        await db_session.refresh(comment)
         return comment
 
     return _create_comment
@@ -167,7 +259,7 @@ def instagram_comment_factory(db_session):
 
 @pytest.fixture
 def media_factory(db_session):
-    """Factory for creating test Media objects."""
+    """Factory for creating test Media objects with a single ``INSERT ... RETURNING``."""
     sentinel = object()
 
     async def _create_media(
@@ -182,7 +274,7 @@ def media_factory(db_session):
         else:
             actual_media_url = media_url
 
-        media = Media(
+        stmt = insert(Media).values(
             id=media_id or fake.uuid4(),
             media_type=media_type,
             media_url=actual_media_url,
@@ -200,10 +292,9 @@ def media_factory(db_session):
             owner=kwargs.get("owner"),
             raw_data=kwargs.get("raw_data"),
             analysis_requested_at=kwargs.get("analysis_requested_at"),
-        )
-        db_session.add(media)
+        ).returning(Media)
+        media = (await db_session.execute(stmt)).scalar_one()
         await db_session.commit()
-        await db_session.refresh(media)
         return media
 
     return _create_media
@@ -289,7 +380,7 @@ def document_factory(db_session):
         else:
             doc_id = uuid.UUID(str(document_id))
 
-        document = Document(
+        stmt = insert(Document).values(
             id=doc_id,
             document_name=doc_name,
             document_type=document_type,
@@ -301,10 +392,9 @@ def document_factory(db_session):
             content_hash=kwargs.get("content_hash", fake.sha256()),
             processing_error=kwargs.get("processing_error"),
             processed_at=kwargs.get("processed_at"),
-        )
-        db_session.add(document)
+        ).returning(Document)
+        document = (await db_session.execute(stmt)).scalar_one()
         await db_session.commit()
-        await db_session.refresh(document)
         return document
 
     return _create_document
@@ -542,6 +632,16 @@ def test_env_vars():
 # ============================================================================
 
 
+FROZEN_NOW = datetime(2025, 11, 16, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def frozen_now():
+    """Freeze wall-clock time for every module in the call chain."""
+    with freeze_time(FROZEN_NOW, real_asyncio=True):
+        yield FROZEN_NOW
+
+
 @pytest.fixture
 def sample_webhook_payload():
     """Sample Instagram webhook payload."""
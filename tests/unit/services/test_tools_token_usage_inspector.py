@@ -8,7 +8,7 @@ from core.models.instrument_token_usage import InstrumentTokenUsage
 
 
 def _session_factory_provider(db_session):
-    return async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    return async_sessionmaker(bind=db_session.bind, expire_on_commit=False, join_transaction_mode="create_savepoint")
 
 
 @pytest.mark.asyncio
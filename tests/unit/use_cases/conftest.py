@@ -0,0 +1,116 @@
+"""
+Shared fixtures for use case tests.
+
+Mock graphs that are identical across tests are built once per session and
+reset around each test that requests them, so recorded calls (which hold
+references to sessions and ORM objects) do not outlive the test.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.interfaces.services import IMediaService, ITaskQueue
+from core.repositories.document import DocumentRepository
+
+
+def _reset(mock: Mock) -> Mock:
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _task_queue_mock() -> Mock:
+    # No magic methods are exercised on the queue, so a plain spec'd Mock is enough.
+    return Mock(spec=ITaskQueue)
+
+
+@pytest.fixture(scope="session")
+def _comment_repo_mock() -> MagicMock:
+    repo = MagicMock()
+    repo.get_latest_comment_timestamp = AsyncMock()
+    repo.get_by_id = AsyncMock()
+    return repo
+
+
+@pytest.fixture(scope="session")
+def _media_service_mock() -> Mock:
+    return Mock(spec=IMediaService)
+
+
+@pytest.fixture(scope="session")
+def _session_mock() -> Mock:
+    return Mock(spec=AsyncSession)
+
+
+@pytest.fixture
+def mock_session(_session_mock):
+    """AsyncSession mock for tests that never need rows to persist."""
+    yield _reset(_session_mock)
+    _reset(_session_mock)
+
+
+@pytest.fixture
+def mock_task_queue(_task_queue_mock):
+    """Task queue mock."""
+    yield _reset(_task_queue_mock)
+    _reset(_task_queue_mock)
+
+
+@pytest.fixture
+def mock_comment_repo(_comment_repo_mock):
+    """Comment repository mock with async lookups."""
+    yield _reset(_comment_repo_mock)
+    _reset(_comment_repo_mock)
+
+
+@pytest.fixture
+def mock_media_service(_media_service_mock):
+    """Media service mock with async get_or_create_media."""
+    yield _reset(_media_service_mock)
+    _reset(_media_service_mock)
+
+
+# The S3 and document processing services are only ever called through a single
+# synchronous method, so a namespace holding one plain Mock stands in for each.
+@pytest.fixture(scope="session")
+def _s3_service_mock() -> SimpleNamespace:
+    return SimpleNamespace(download_file=Mock())
+
+
+@pytest.fixture(scope="session")
+def _doc_processing_mock() -> SimpleNamespace:
+    return SimpleNamespace(process_document=Mock())
+
+
+@pytest.fixture(scope="session")
+def _document_repo_mock() -> Mock:
+    # spec= turns the repository's coroutine methods into AsyncMocks and rejects
+    # misspelled attributes, without the signature introspection of autospec.
+    return Mock(spec=DocumentRepository)
+
+
+@pytest.fixture
+def mock_s3_service(_s3_service_mock):
+    """S3 service mock with a synchronous download_file."""
+    _reset(_s3_service_mock.download_file)
+    yield _s3_service_mock
+    _reset(_s3_service_mock.download_file)
+
+
+@pytest.fixture
+def mock_doc_processing(_doc_processing_mock):
+    """Document processing service mock with a synchronous process_document."""
+    _reset(_doc_processing_mock.process_document)
+    yield _doc_processing_mock
+    _reset(_doc_processing_mock.process_document)
+
+
+@pytest.fixture
+def mock_document_repo(_document_repo_mock):
+    """Document repository mock with async lookup and status transitions."""
+    yield _reset(_document_repo_mock)
+    _reset(_document_repo_mock)
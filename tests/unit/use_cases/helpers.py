@@ -0,0 +1,67 @@
+"""Stand-ins shared by the use case tests."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+# Fixed instants keep the serialized timestamps deterministic.
+FIXED_UTC = datetime(2025, 11, 16, 12, 0, tzinfo=timezone.utc)
+FIXED_DB_UTC = FIXED_UTC.replace(tzinfo=None)  # naive, like now_db_utc()
+
+# Placeholder for collaborators the code path under test never touches.
+UNUSED = object()
+
+
+def fake_media(**fields):
+    """Attribute bag with the Media fields the media use cases read and update."""
+    defaults = dict(
+        id=None,
+        permalink=None,
+        username=None,
+        media_type=None,
+        media_url=None,
+        children_media_urls=None,
+        caption=None,
+        media_context=None,
+        analysis_requested_at=None,
+        comments_count=None,
+        like_count=None,
+        created_at=None,
+        posted_at=None,
+    )
+    return SimpleNamespace(**{**defaults, **fields})
+
+
+class AsyncReturn:
+    """Awaitable stand-in for a collaborator method whose calls are not asserted."""
+
+    def __init__(self, value):
+        self.value = value
+
+    async def __call__(self, *args, **kwargs):
+        return self.value
+
+
+class Recorder:
+    """Awaitable stand-in that records its calls and returns, or raises, a fixed outcome."""
+
+    __slots__ = ("outcome", "calls")
+
+    def __init__(self, outcome=None):
+        self.outcome = outcome
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+class AsyncRaise:
+    """Awaitable stand-in for a collaborator method that fails."""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+    async def __call__(self, *args, **kwargs):
+        raise self.exc
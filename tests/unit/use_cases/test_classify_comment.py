@@ -92,7 +92,9 @@ class TestClassifyCommentUseCase:
 
         # Verify service calls
         mock_comment_repo.get_with_classification.assert_awaited_once_with("comment_1")
-        mock_media_service.get_or_create_media.assert_awaited_once_with("media_1", db_session)
+        mock_media_service.get_or_create_media.assert_awaited_once()
+        media_id, session = mock_media_service.get_or_create_media.await_args.args
+        assert media_id == "media_1" and session is db_session
         mock_classification_service.generate_conversation_id.assert_called_once()
         mock_classification_service.classify_comment.assert_awaited_once()
         mock_classification_repo.mark_completed.assert_awaited_once()
@@ -1,8 +1,7 @@
-from __future__ import annotations
-
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import event, insert
 
 from core.models.comment_classification import CommentClassification, ProcessingStatus
 from core.models.instagram_comment import InstagramComment
@@ -12,19 +11,19 @@ from core.repositories.moderation_stats_report import ModerationStatsReportRepos
 from core.use_cases.generate_moderation_stats import GenerateModerationStatsUseCase
 from core.use_cases.generate_stats_report import StatsPeriod
 
+NOV_BASE = datetime(2025, 11, 10, 9, 0)
+NOV_HOURS = tuple(NOV_BASE + timedelta(hours=i) for i in range(8))
+_TWO_HOURS = timedelta(hours=2)
 
-def _freeze_now(monkeypatch, target_module):
-    fixed_now = datetime(2025, 11, 16, 12, 0, tzinfo=timezone.utc)
-
-    class FrozenDateTime(datetime):
-        @classmethod
-        def now(cls, tz=None):
-            if tz is None:
-                return fixed_now.replace(tzinfo=None)
-            return fixed_now.astimezone(tz)
 
-    monkeypatch.setattr(target_module, "datetime", FrozenDateTime)
-    return fixed_now
+@pytest.fixture
+def moderation_stats_use_case(db_session):
+    """Use case wired to real repositories on the test session."""
+    return GenerateModerationStatsUseCase(
+        session=db_session,
+        moderation_stats_repository_factory=ModerationStatsRepository,
+        moderation_stats_report_repository_factory=ModerationStatsReportRepository,
+    )
 
 
 def _make_comment(
@@ -37,200 +36,135 @@ def _make_comment(
     is_deleted: bool = False,
     deleted_at: datetime | None = None,
     deleted_by_ai: bool = False,
-) -> InstagramComment:
-    return InstagramComment(
-        id=comment_id,
-        media_id="media",
-        user_id="user",
-        username="tester",
-        text="sample",
-        created_at=created_at,
-        raw_data={},
-        is_hidden=is_hidden,
-        hidden_at=hidden_at,
-        hidden_by_ai=hidden_by_ai,
-        is_deleted=is_deleted,
-        deleted_at=deleted_at,
-        deleted_by_ai=deleted_by_ai,
-    )
+) -> dict:
+    return {
+        "id": comment_id,
+        "media_id": "media",
+        "user_id": "user",
+        "username": "tester",
+        "text": "sample",
+        "created_at": created_at,
+        "raw_data": {},
+        "is_hidden": is_hidden,
+        "hidden_at": hidden_at,
+        "hidden_by_ai": hidden_by_ai,
+        "is_deleted": is_deleted,
+        "deleted_at": deleted_at,
+        "deleted_by_ai": deleted_by_ai,
+    }
 
 
 def _make_classification(
     comment_id: str,
-    idx: int,
     *,
     type_label: str | None,
     status: ProcessingStatus = ProcessingStatus.COMPLETED,
-    created_at: datetime,
-) -> CommentClassification:
-    completed_at = created_at + timedelta(hours=2) if status == ProcessingStatus.COMPLETED else None
-    return CommentClassification(
-        comment_id=comment_id,
-        processing_status=status,
-        processing_completed_at=completed_at,
-        type=type_label,
-    )
+    created_at: datetime | None = None,
+    completed_at: datetime | None = None,
+) -> dict:
+    if completed_at is None and created_at is not None and status == ProcessingStatus.COMPLETED:
+        completed_at = created_at + _TWO_HOURS
+    return {
+        "comment_id": comment_id,
+        "processing_status": status,
+        "processing_completed_at": completed_at,
+        "type": type_label,
+    }
+
+
+def _make_answer(comment_id: str, *, answer: str, reply_sent_at: datetime, is_ai_generated: bool) -> dict:
+    return {
+        "comment_id": comment_id,
+        "processing_status": AnswerStatus.COMPLETED,
+        "answer": answer,
+        "reply_sent": True,
+        "reply_sent_at": reply_sent_at,
+        "is_deleted": False,
+        "is_ai_generated": is_ai_generated,
+    }
 
 
 @pytest.mark.asyncio
-async def test_generate_moderation_stats(monkeypatch, db_session):
-    from core.use_cases import generate_moderation_stats as moderation_module
-
-    _freeze_now(monkeypatch, moderation_module)
-
-    # October data to ensure previous month is present
-    oct_comment = _make_comment(comment_id="oct", created_at=datetime(2025, 10, 5, 12, 0))
-    oct_classification = _make_classification(
-        "oct", 1, type_label="spam / irrelevant", created_at=oct_comment.created_at
-    )
-
-    # November data
-    nov_base = datetime(2025, 11, 10, 9, 0)
-    spam_comment = _make_comment(comment_id="spam", created_at=nov_base)
-    spam_classification = _make_classification(
-        "spam", 2, type_label="Spam / irrelevant", created_at=nov_base
-    )
-
-    adult_comment = _make_comment(comment_id="adult", created_at=nov_base + timedelta(hours=1))
-    adult_classification = _make_classification(
-        "adult", 3, type_label="18+ content", created_at=adult_comment.created_at
-    )
-
-    toxic_comment = _make_comment(comment_id="toxic", created_at=nov_base + timedelta(hours=2))
-    toxic_classification = _make_classification(
-        "toxic", 4, type_label="toxic / abusive", created_at=toxic_comment.created_at
-    )
-
-    other_comment = _make_comment(comment_id="other", created_at=nov_base + timedelta(hours=3))
-    other_classification = _make_classification(
-        "other", 5, type_label="Scam request", created_at=other_comment.created_at
-    )
-
-    complaint_created = _make_comment(comment_id="complaint-new", created_at=nov_base + timedelta(hours=4))
-    complaint_pending = CommentClassification(
-        comment_id="complaint-new",
-        processing_status=ProcessingStatus.PENDING,
-        type="urgent issue / complaint",
-    )
-
-    complaint_done_comment = _make_comment(comment_id="complaint-done", created_at=nov_base + timedelta(hours=5))
-    complaint_done = _make_classification(
-        "complaint-done",
-        6,
-        type_label="urgent issue / complaint",
-        created_at=complaint_done_comment.created_at,
-    )
-
-    qa_ai_comment = _make_comment(comment_id="qa-ai", created_at=nov_base + timedelta(hours=6))
-    qa_ai_classification = _make_classification(
-        "qa-ai",
-        7,
-        type_label="question / inquiry",
-        created_at=qa_ai_comment.created_at,
-    )
-    qa_ai_answer = QuestionAnswer(
-        comment_id="qa-ai",
-        processing_status=AnswerStatus.COMPLETED,
-        answer="Auto reply",
-        reply_sent=True,
-        reply_sent_at=nov_base + timedelta(hours=6, minutes=30),
-        is_deleted=False,
-        is_ai_generated=True,
-    )
-
-    qa_manual_comment = _make_comment(comment_id="qa-manual", created_at=nov_base + timedelta(hours=7))
-    qa_manual_classification = _make_classification(
-        "qa-manual",
-        8,
-        type_label="question / inquiry",
-        created_at=qa_manual_comment.created_at,
-    )
-    qa_manual_answer = QuestionAnswer(
-        comment_id="qa-manual",
-        processing_status=AnswerStatus.COMPLETED,
-        answer="Manual reply",
-        reply_sent=True,
-        reply_sent_at=nov_base + timedelta(hours=7, minutes=15),
-        is_deleted=False,
-        is_ai_generated=False,
-    )
-
-    legacy_comment = _make_comment(
-        comment_id="legacy",
-        created_at=datetime(2025, 9, 1, 10, 0),
-    )
-    legacy_classification = CommentClassification(
-        comment_id="legacy",
-        processing_status=ProcessingStatus.COMPLETED,
-        processing_completed_at=datetime(2025, 11, 12, 10, 0),
-        type="spam / irrelevant",
-    )
-
-    hidden_comment = _make_comment(
-        comment_id="hidden",
-        created_at=nov_base,
-        is_hidden=True,
-        hidden_at=datetime(2025, 11, 12, 8, 0),
-        hidden_by_ai=True,
-    )
-    hidden_classification = _make_classification(
-        "hidden", 7, type_label="spam / irrelevant", created_at=hidden_comment.created_at
-    )
-
-    deleted_comment = _make_comment(
-        comment_id="deleted",
-        created_at=nov_base,
-        is_deleted=True,
-        deleted_at=datetime(2025, 11, 13, 9, 0),
-        deleted_by_ai=True,
-    )
-    deleted_classification = _make_classification(
-        "deleted", 8, type_label="spam / irrelevant", created_at=deleted_comment.created_at
-    )
-
-    db_session.add_all(
-        [
-            oct_comment,
-            spam_comment,
-            adult_comment,
-            toxic_comment,
-            other_comment,
-            complaint_created,
-            complaint_done_comment,
-            qa_ai_comment,
-            qa_manual_comment,
-            hidden_comment,
-            deleted_comment,
-            legacy_comment,
-        ]
-    )
-    db_session.add_all(
-        [
-            oct_classification,
-            spam_classification,
-            adult_classification,
-            toxic_classification,
-            other_classification,
-            complaint_pending,
-            complaint_done,
-            qa_ai_classification,
-            qa_manual_classification,
-            hidden_classification,
-            deleted_classification,
-            qa_ai_answer,
-            qa_manual_answer,
-            legacy_classification,
-        ]
-    )
-    await db_session.commit()
-
-    use_case = GenerateModerationStatsUseCase(
-        session=db_session,
-        moderation_stats_repository_factory=lambda session: ModerationStatsRepository(session),
-        moderation_stats_report_repository_factory=lambda session: ModerationStatsReportRepository(session),
-    )
-
-    result = await use_case.execute(StatsPeriod.LAST_MONTH)
+async def test_generate_moderation_stats(frozen_now, db_session, moderation_stats_use_case):
+    comments = [
+        # October data to ensure previous month is present
+        _make_comment(comment_id="oct", created_at=datetime(2025, 10, 5, 12, 0)),
+        # November data
+        _make_comment(comment_id="spam", created_at=NOV_HOURS[0]),
+        _make_comment(comment_id="adult", created_at=NOV_HOURS[1]),
+        _make_comment(comment_id="toxic", created_at=NOV_HOURS[2]),
+        _make_comment(comment_id="other", created_at=NOV_HOURS[3]),
+        _make_comment(comment_id="complaint-new", created_at=NOV_HOURS[4]),
+        _make_comment(comment_id="complaint-done", created_at=NOV_HOURS[5]),
+        _make_comment(comment_id="qa-ai", created_at=NOV_HOURS[6]),
+        _make_comment(comment_id="qa-manual", created_at=NOV_HOURS[7]),
+        _make_comment(
+            comment_id="hidden",
+            created_at=NOV_HOURS[0],
+            is_hidden=True,
+            hidden_at=datetime(2025, 11, 12, 8, 0),
+            hidden_by_ai=True,
+        ),
+        _make_comment(
+            comment_id="deleted",
+            created_at=NOV_HOURS[0],
+            is_deleted=True,
+            deleted_at=datetime(2025, 11, 13, 9, 0),
+            deleted_by_ai=True,
+        ),
+        _make_comment(comment_id="legacy", created_at=datetime(2025, 9, 1, 10, 0)),
+    ]
+    created_at = {row["id"]: row["created_at"] for row in comments}
+
+    classifications = [
+        _make_classification("oct", type_label="spam / irrelevant", created_at=created_at["oct"]),
+        _make_classification("spam", type_label="Spam / irrelevant", created_at=created_at["spam"]),
+        _make_classification("adult", type_label="18+ content", created_at=created_at["adult"]),
+        _make_classification("toxic", type_label="toxic / abusive", created_at=created_at["toxic"]),
+        _make_classification("other", type_label="Scam request", created_at=created_at["other"]),
+        _make_classification(
+            "complaint-new",
+            type_label="urgent issue / complaint",
+            status=ProcessingStatus.PENDING,
+        ),
+        _make_classification(
+            "complaint-done",
+            type_label="urgent issue / complaint",
+            created_at=created_at["complaint-done"],
+        ),
+        _make_classification("qa-ai", type_label="question / inquiry", created_at=created_at["qa-ai"]),
+        _make_classification("qa-manual", type_label="question / inquiry", created_at=created_at["qa-manual"]),
+        _make_classification("hidden", type_label="spam / irrelevant", created_at=created_at["hidden"]),
+        _make_classification("deleted", type_label="spam / irrelevant", created_at=created_at["deleted"]),
+        _make_classification(
+            "legacy",
+            type_label="spam / irrelevant",
+            completed_at=datetime(2025, 11, 12, 10, 0),
+        ),
+    ]
+
+    answers = [
+        _make_answer(
+            "qa-ai",
+            answer="Auto reply",
+            reply_sent_at=NOV_HOURS[6] + timedelta(minutes=30),
+            is_ai_generated=True,
+        ),
+        _make_answer(
+            "qa-manual",
+            answer="Manual reply",
+            reply_sent_at=NOV_HOURS[7] + timedelta(minutes=15),
+            is_ai_generated=False,
+        ),
+    ]
+
+    # Seed through Core inserts: the assertions only look at aggregated results,
+    # so there is no need to build ORM instances for every row.
+    await db_session.execute(insert(InstagramComment), comments)
+    await db_session.execute(insert(CommentClassification), classifications)
+    await db_session.execute(insert(QuestionAnswer), answers)
+
+    result = await moderation_stats_use_case.execute(StatsPeriod.LAST_MONTH)
     assert result["period"] == StatsPeriod.LAST_MONTH.value
     assert len(result["months"]) == 2
 
@@ -239,7 +173,7 @@ async def test_generate_moderation_stats(monkeypatch, db_session):
     assert summary["total_verified_content"] == 10
     assert summary["complaints_total"] == 2
     assert summary["complaints_processed"] == 1
-    assert summary["average_reaction_time_seconds"] == pytest.approx(6525.0)
+    assert summary["average_reaction_time_seconds"] == 6525.0  # (1800 + 7 * 7200) / 8, exact in float
 
     violations = november_stats["violations"]
     assert violations["spam_advertising"] == 4
@@ -253,3 +187,42 @@ async def test_generate_moderation_stats(monkeypatch, db_session):
     assert ai_stats["hidden_comments"]["manual"] == 0
     assert ai_stats["deleted_content"]["ai"] == 1
     assert ai_stats["deleted_content"]["manual"] == 0
+
+
+async def _query_plan(db_session, query) -> str:
+    """Run ``query`` and return SQLite's EXPLAIN QUERY PLAN for the statement it emitted."""
+    connection = await db_session.connection()
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", _capture)
+    try:
+        await query
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", _capture)
+
+    ((statement, parameters),) = statements
+    plan = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return "\n".join(row[-1] for row in plan)
+
+
+@pytest.mark.asyncio
+async def test_verified_count_searches_classification_status_index(db_session):
+    repo = ModerationStatsRepository(db_session)
+
+    plan = await _query_plan(db_session, repo._count_verified(NOV_BASE, NOV_BASE + timedelta(days=30)))
+
+    assert "USING COVERING INDEX ix_comments_classification_status_completed_type" in plan
+
+
+@pytest.mark.asyncio
+async def test_complaint_count_searches_comment_created_at_index(db_session):
+    repo = ModerationStatsRepository(db_session)
+
+    plan = await _query_plan(
+        db_session, repo._count_complaints(NOV_BASE, NOV_BASE + timedelta(days=30), processed_only=False)
+    )
+
+    assert "SEARCH instagram_comments USING INDEX ix_instagram_comments_created_at" in plan
@@ -1,11 +1,9 @@
-from __future__ import annotations
-
-from datetime import datetime, timezone
+import asyncio
+from datetime import datetime
 
 import pytest
 
 from core.config import settings
-from core.use_cases import generate_stats_report as stats_module
 from core.use_cases.generate_stats_report import (
     GenerateStatsReportUseCase,
     StatsPeriod,
@@ -49,6 +47,7 @@ class FakeInstagramService:
 
     async def get_insights(self, account_id: str, params: dict):
         self.calls.append({"account_id": account_id, **params})
+        await asyncio.sleep(0)
         if not self.success:
             return {"success": False, "error": "boom"}
         return {
@@ -70,23 +69,8 @@ def _month_key(year: int, month: int):
     return start, end
 
 
-def _freeze_now(monkeypatch, target):
-    fixed_now = datetime(2025, 11, 16, 12, 0, tzinfo=timezone.utc)
-
-    class FrozenDateTime(datetime):
-        @classmethod
-        def now(cls, tz=None):
-            if tz is None:
-                return fixed_now.replace(tzinfo=None)
-            return fixed_now.astimezone(tz)
-
-    monkeypatch.setattr(target, "datetime", FrozenDateTime)
-    return fixed_now
-
-
 @pytest.mark.asyncio
-async def test_generate_stats_report_reuses_cached_months(monkeypatch, db_session):
-    _freeze_now(monkeypatch, stats_module)
+async def test_generate_stats_report_reuses_cached_months(frozen_now, monkeypatch, db_session):
     monkeypatch.setattr(settings.instagram, "base_account_id", "17841476998475313")
 
     cached = {}
@@ -130,15 +114,20 @@ async def test_generate_stats_report_reuses_cached_months(monkeypatch, db_sessio
     engagement_payload = current_month["insights"]["engagement"]
     metric_name = engagement_payload.get("metric") or engagement_payload.get("data", [{}])[0].get("metric")
     assert metric_name.split(",")[0] == "views"
-    assert len(service.calls) == 4  # four metrics for current month
+    assert len(service.calls) == 4  # four metrics for current month, fetched concurrently
+    assert sorted(call["metric"].split(",")[0] for call in service.calls) == [
+        "profile_links_taps",
+        "replies",
+        "views",
+        "views",
+    ]
     assert len(repo.saved) == 1  # only current month stored
     # Ensure cached ranges were looked up
     assert len(repo.range_queries) == 3
 
 
 @pytest.mark.asyncio
-async def test_generate_stats_report_handles_missing_account(monkeypatch, db_session):
-    _freeze_now(monkeypatch, stats_module)
+async def test_generate_stats_report_handles_missing_account(frozen_now, monkeypatch, db_session):
     monkeypatch.setattr(settings.instagram, "base_account_id", "")
 
     repo = FakeStatsReportRepository()
@@ -155,8 +144,7 @@ async def test_generate_stats_report_handles_missing_account(monkeypatch, db_ses
 
 
 @pytest.mark.asyncio
-async def test_generate_stats_report_raises_on_failed_insights(monkeypatch, db_session):
-    _freeze_now(monkeypatch, stats_module)
+async def test_generate_stats_report_raises_on_failed_insights(frozen_now, monkeypatch, db_session):
     monkeypatch.setattr(settings.instagram, "base_account_id", "17841476998475313")
 
     repo = FakeStatsReportRepository()
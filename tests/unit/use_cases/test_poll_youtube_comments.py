@@ -6,61 +6,101 @@ use case executes end-to-end without raising when polling YouTube comments.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import Mock
 
 from core.config import settings
+from core.models import Media
+from core.repositories.classification import ClassificationRepository
+from core.repositories.media import MediaRepository
 from core.use_cases.poll_youtube_comments import PollYouTubeCommentsUseCase
 
+# Shared, read-only API response (the use case never mutates it)
+_EMPTY_THREADS = {"items": []}
+
+
+class FakeYouTubeService:
+    def __init__(self, video_ids=(), threads_response=_EMPTY_THREADS):
+        self.videos_response = {"items": [{"id": {"videoId": video_id}} for video_id in video_ids]}
+        self.threads_response = threads_response
+        self.channel_video_calls = []
+        self.comment_thread_calls = []
+
+    async def list_channel_videos(self, **kwargs):
+        self.channel_video_calls.append(kwargs)
+        return self.videos_response
+
+    async def list_comment_threads(self, **kwargs):
+        self.comment_thread_calls.append(kwargs)
+        return self.threads_response
+
+
+class FakeYouTubeMediaService:
+    def __init__(self):
+        self.calls = []
+        self._media = {}
+
+    async def get_or_create_video(self, video_id, session):
+        self.calls.append((video_id, session))
+        # Transient media per video id; the use case only checks that one is returned
+        if video_id not in self._media:
+            self._media[video_id] = Media(
+                id=video_id, permalink=f"https://www.youtube.com/watch?v={video_id}", media_type="VIDEO"
+            )
+        return self._media[video_id]
+
 
-@pytest.mark.unit
-@pytest.mark.use_case
 class TestPollYouTubeCommentsUseCase:
     """Tests for polling YouTube comments."""
 
+    @pytest.mark.parametrize(
+        "video_ids,expected_count",
+        [
+            (["video_1"], 1),
+            ([], 0),
+            (["video_1", "video_2", "video_3"], 3),
+        ],
+        ids=["single_video", "no_videos", "many_videos"],
+    )
     async def test_execute_uses_channel_settings(
         self,
         db_session,
-        media_factory,
+        mock_task_queue,
+        mock_comment_repo,
+        video_ids,
+        expected_count,
     ):
         """Ensure we fetch recent videos with configured poll limits and no NameError."""
-        # Arrange: mock YouTube service responses
-        youtube_service = MagicMock()
-        youtube_service.list_channel_videos = AsyncMock(
-            return_value={"items": [{"id": {"videoId": "video_1"}}]}
-        )
-        youtube_service.list_comment_threads = AsyncMock(return_value={"items": []})
+        # Arrange: fake YouTube API responses
+        youtube_service = FakeYouTubeService(video_ids)
+        youtube_media_service = FakeYouTubeMediaService()
 
-        # Persist media to avoid None path
-        media = await media_factory(media_id="video_1")
-        youtube_media_service = MagicMock()
-        youtube_media_service.get_or_create_video = AsyncMock(return_value=media)
-
-        task_queue = MagicMock()
-
-        comment_repo = MagicMock()
-        comment_repo.get_latest_comment_timestamp = AsyncMock(return_value=None)
-        comment_repo.get_by_id = AsyncMock(return_value=None)
+        mock_comment_repo.get_latest_comment_timestamp.return_value = None
+        mock_comment_repo.get_by_id.return_value = None
 
         # Factories return pre-configured mocks
         use_case = PollYouTubeCommentsUseCase(
             session=db_session,
             youtube_service=youtube_service,
             youtube_media_service=youtube_media_service,
-            task_queue=task_queue,
-            comment_repository_factory=lambda session: comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-            classification_repository_factory=lambda session: MagicMock(),
+            task_queue=mock_task_queue,
+            comment_repository_factory=lambda session: mock_comment_repo,
+            media_repository_factory=lambda session: Mock(spec=MediaRepository),
+            classification_repository_factory=lambda session: Mock(spec=ClassificationRepository),
         )
 
         # Act
         result = await use_case.execute()
 
         # Assert
-        youtube_service.list_channel_videos.assert_awaited_once()
-        kwargs = youtube_service.list_channel_videos.await_args.kwargs
-        assert kwargs["max_results"] == settings.youtube.poll_max_videos
-        youtube_media_service.get_or_create_video.assert_awaited_once_with("video_1", db_session)
-        youtube_service.list_comment_threads.assert_awaited_once()
+        call_counts = (
+            len(youtube_service.channel_video_calls),
+            len(youtube_service.comment_thread_calls),
+            len(youtube_media_service.calls),
+        )
+        assert call_counts == (1, expected_count, expected_count)
+        assert youtube_service.channel_video_calls[0]["max_results"] == settings.youtube.poll_max_videos
+        assert [video_id for video_id, _ in youtube_media_service.calls] == video_ids
+        assert all(session is db_session for _, session in youtube_media_service.calls)
 
         assert result["status"] == "success"
-        assert result["video_count"] == 1
+        assert result["video_count"] == expected_count
@@ -0,0 +1,255 @@
+"""
+Unit tests for AnalyzeMediaUseCase.
+
+Tests cover:
+- Image and carousel analysis with AI
+- Edge cases: media not found, already analyzed, no images
+- Error handling and status tracking
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.use_cases.process_media import REASON_MEDIA_NOT_FOUND, REASON_NO_RESULT, AnalyzeMediaUseCase
+from tests.unit.use_cases.helpers import AsyncRaise, AsyncReturn, FIXED_DB_UTC, Recorder, UNUSED, fake_media
+
+_IMAGE = {"media_type": "IMAGE", "media_url": "https://example.com/image.jpg"}
+_CAROUSEL = {
+    "media_type": "CAROUSEL_ALBUM",
+    "media_url": "https://example.com/carousel.jpg",
+    "children_media_urls": ["url1.jpg", "url2.jpg"],
+}
+
+# AnalyzeMediaUseCase paths that skip analysis or end in an error, as
+# (id, media fields or None for a missing row, repository error, analysis outcome,
+#  expected status, reason, media_context afterwards).
+_SKIP_OR_ERROR_CASES = (
+    ("media_not_found", None, None, None, "error", REASON_MEDIA_NOT_FOUND, None),
+    (
+        "already_analyzed",
+        {**_IMAGE, "media_context": "Already analyzed"},
+        None,
+        None,
+        "skipped",
+        "already_analyzed",
+        "Already analyzed",
+    ),
+    (
+        "video",
+        {"media_type": "VIDEO", "media_url": "https://example.com/video.mp4"},
+        None,
+        None,
+        "skipped",
+        "no_image_to_analyze",
+        None,
+    ),
+    (
+        "image_without_url",
+        {"media_type": "IMAGE", "media_url": None},
+        None,
+        None,
+        "skipped",
+        "no_image_to_analyze",
+        None,
+    ),
+    (
+        "analysis_exception",
+        _IMAGE,
+        None,
+        Exception("Vision API timeout"),
+        "error",
+        "Analysis failed with exception: Vision API timeout",
+        "ANALYSIS_FAILED",
+    ),
+    ("analysis_returns_none", _IMAGE, None, None, "error", REASON_NO_RESULT, "ANALYSIS_FAILED"),
+    (
+        "carousel_exception",
+        _CAROUSEL,
+        None,
+        Exception("Carousel analysis failed"),
+        "error",
+        "Analysis failed with exception: Carousel analysis failed",
+        "ANALYSIS_FAILED",
+    ),
+    ("unexpected_exception", None, Exception("Unexpected error"), None, "error", "Unexpected error", None),
+)
+
+
+def _analyze_media_use_case(session, media_repo, *, analysis_service=UNUSED):
+    return AnalyzeMediaUseCase(
+        session=session,
+        analysis_service=analysis_service,
+        media_repository_factory=lambda session: media_repo,
+    )
+
+
+class TestAnalyzeMediaUseCase:
+    """Test AnalyzeMediaUseCase methods."""
+
+    async def test_execute_single_image_success(self, mock_session):
+        """Test successfully analyzing single image."""
+        # Arrange
+        media = fake_media(
+            id="media_img",
+            media_type="IMAGE",
+            media_url="https://example.com/image.jpg",
+            caption="Beautiful sunset",
+            media_context=None,
+            analysis_requested_at=FIXED_DB_UTC,
+        )
+
+        # Mock analysis service
+        mock_analysis_service = SimpleNamespace(
+            analyze_media_image=Recorder("Analysis: Sunset over ocean with warm colors")
+        )
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(media))
+
+        # Create use case
+        use_case = _analyze_media_use_case(mock_session, mock_media_repo, analysis_service=mock_analysis_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_img")
+
+        # Assert
+        assert result.status == "success"
+        assert result.media_id == "media_img"
+        assert result.media_context == "Analysis: Sunset over ocean with warm colors"
+        assert result.images_analyzed == 1
+
+        # Verify analysis service called
+        assert mock_analysis_service.analyze_media_image.calls == [
+            ((), {"media_url": "https://example.com/image.jpg", "caption": "Beautiful sunset"})
+        ]
+
+        # Verify media updated
+        assert media.media_context == "Analysis: Sunset over ocean with warm colors"
+        assert media.analysis_requested_at is None
+        mock_session.commit.assert_awaited_once()
+
+    async def test_execute_carousel_images_success(self, mock_session):
+        """Test successfully analyzing carousel images."""
+        # Arrange
+        media = fake_media(
+            id="media_carousel",
+            media_type="CAROUSEL_ALBUM",
+            media_url="https://example.com/carousel_cover.jpg",
+            caption="Product showcase",
+            media_context=None,
+            analysis_requested_at=FIXED_DB_UTC,
+            children_media_urls=[
+                "https://example.com/img1.jpg",
+                "https://example.com/img2.jpg",
+                "https://example.com/img3.jpg",
+            ],
+        )
+
+        # Mock analysis service
+        mock_analysis_service = SimpleNamespace(
+            analyze_carousel_images=Recorder("Analysis: Product display from multiple angles")
+        )
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(media))
+
+        # Create use case
+        use_case = _analyze_media_use_case(mock_session, mock_media_repo, analysis_service=mock_analysis_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_carousel")
+
+        # Assert
+        assert result.status == "success"
+        assert result.media_id == "media_carousel"
+        assert result.images_analyzed == 3
+
+        # Verify carousel analysis called
+        assert mock_analysis_service.analyze_carousel_images.calls == [
+            (
+                (),
+                {
+                    "media_urls": [
+                        "https://example.com/img1.jpg",
+                        "https://example.com/img2.jpg",
+                        "https://example.com/img3.jpg",
+                    ],
+                    "caption": "Product showcase",
+                },
+            )
+        ]
+        assert media.analysis_requested_at is None
+
+    @pytest.mark.parametrize(
+        "media_kwargs, repo_error, analysis, status, reason, media_context",
+        [case[1:] for case in _SKIP_OR_ERROR_CASES],
+        ids=[case[0] for case in _SKIP_OR_ERROR_CASES],
+    )
+    async def test_execute_skip_or_error(
+        self, mock_session, media_kwargs, repo_error, analysis, status, reason, media_context
+    ):
+        """Test the paths that skip analysis or end in an error result."""
+        # Arrange
+        media = None
+        if media_kwargs is not None:
+            media = fake_media(id="media_case", analysis_requested_at=FIXED_DB_UTC, **media_kwargs)
+        get_by_id = AsyncRaise(repo_error) if repo_error else AsyncReturn(media)
+        mock_media_repo = SimpleNamespace(get_by_id=get_by_id)
+
+        mock_analysis_service = SimpleNamespace(
+            analyze_media_image=Recorder(analysis),
+            analyze_carousel_images=Recorder(analysis),
+        )
+
+        use_case = _analyze_media_use_case(mock_session, mock_media_repo, analysis_service=mock_analysis_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_case")
+
+        # Assert
+        assert result.status == status
+        assert result.media_id == "media_case"
+        assert result.reason == reason
+
+        # Analysis only runs once the media passes the skip checks, and then fails
+        analysis_calls = len(mock_analysis_service.analyze_media_image.calls) + len(
+            mock_analysis_service.analyze_carousel_images.calls
+        )
+        assert analysis_calls == (1 if media_context == "ANALYSIS_FAILED" else 0)
+
+        if media is not None:
+            assert media.media_context == media_context
+            assert media.analysis_requested_at is None
+            mock_session.commit.assert_awaited_once()
+        else:
+            mock_session.commit.assert_not_awaited()
+
+    async def test_execute_carousel_without_children_urls(self, mock_session):
+        """Test carousel analysis when children_media_urls is None/empty."""
+        # Arrange
+        media = fake_media(
+            id="media_carousel_empty",
+            media_type="CAROUSEL_ALBUM",
+            media_url="https://example.com/carousel.jpg",
+            media_context=None,
+        )
+
+        # Mock analysis service
+        mock_analysis_service = SimpleNamespace(analyze_media_image=Recorder("Single image analysis"))
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(media))
+
+        # Create use case
+        use_case = _analyze_media_use_case(mock_session, mock_media_repo, analysis_service=mock_analysis_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_carousel_empty")
+
+        # Assert
+        assert result.status == "success"
+        # Should fallback to single image analysis
+        assert len(mock_analysis_service.analyze_media_image.calls) == 1
+        assert result.images_analyzed == 1
+        assert media.analysis_requested_at is None
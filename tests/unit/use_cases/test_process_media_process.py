@@ -0,0 +1,180 @@
+"""
+Unit tests for ProcessMediaUseCase.
+
+Tests cover:
+- Media fetching and creation
+- Edge cases: media already exists, API fetch failure
+- Error handling and timestamp serialization
+"""
+
+from types import SimpleNamespace
+
+from core.use_cases.process_media import ProcessMediaUseCase
+from tests.unit.use_cases.helpers import AsyncRaise, AsyncReturn, FIXED_DB_UTC, FIXED_UTC, Recorder, UNUSED, fake_media
+
+
+def _process_media_use_case(session, media_repo, *, media_service=UNUSED):
+    return ProcessMediaUseCase(
+        session=session,
+        media_service=media_service,
+        analysis_service=UNUSED,
+        media_repository_factory=lambda session: media_repo,
+    )
+
+
+class TestProcessMediaUseCase:
+    """Test ProcessMediaUseCase methods."""
+
+    async def test_execute_new_media_success(self, mock_session):
+        """Test successfully creating new media."""
+        # Arrange
+        new_media = fake_media(
+            id="media_1",
+            permalink="https://instagram.com/p/test",
+            username="testuser",
+            media_type="IMAGE",
+            comments_count=10,
+            like_count=100,
+        )
+
+        # Mock services
+        mock_media_service = SimpleNamespace(get_or_create_media=Recorder(new_media))
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(None))
+
+        # Create use case
+        use_case = _process_media_use_case(mock_session, mock_media_repo, media_service=mock_media_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_1")
+
+        # Assert
+        assert result.status == "success"
+        assert result.media_id == "media_1"
+        assert result.action == "created"
+        assert result.media["id"] == "media_1"
+        assert result.media["username"] == "testuser"
+        assert result.media["media_type"] == "IMAGE"
+        assert result.media["comments_count"] == 10
+        assert result.media["like_count"] == 100
+
+        # Verify service called
+        [(args, kwargs)] = mock_media_service.get_or_create_media.calls
+        assert args[0] == "media_1" and args[1] is mock_session and not kwargs
+
+    async def test_execute_existing_media(self, mock_session):
+        """Test handling existing media."""
+        # Arrange
+        existing_media = fake_media(
+            id="media_existing",
+            username="existing_user",
+            media_type="VIDEO",
+        )
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(existing_media))
+
+        # Create use case
+        use_case = _process_media_use_case(mock_session, mock_media_repo)
+
+        # Act
+        result = await use_case.execute(media_id="media_existing")
+
+        # Assert
+        assert result.status == "success"
+        assert result.media_id == "media_existing"
+        assert result.action == "already_exists"
+        assert result.media["username"] == "existing_user"
+
+    async def test_execute_api_fetch_failed(self, mock_session):
+        """Test handling when Instagram API fetch fails."""
+        # Mock services
+        mock_media_service = SimpleNamespace(get_or_create_media=AsyncReturn(None))
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(None))
+
+        # Create use case
+        use_case = _process_media_use_case(mock_session, mock_media_repo, media_service=mock_media_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_failed")
+
+        # Assert
+        assert result.status == "error"
+        assert result.media_id == "media_failed"
+        assert result.reason == "api_fetch_failed"
+
+    async def test_execute_unexpected_exception(self, mock_session):
+        """Test handling unexpected exceptions."""
+        # Mock repository that raises exception
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncRaise(Exception("Database error")))
+
+        # Create use case
+        use_case = _process_media_use_case(mock_session, mock_media_repo)
+
+        # Act
+        result = await use_case.execute(media_id="media_error")
+
+        # Assert
+        assert result.status == "error"
+        assert result.media_id == "media_error"
+        assert result.reason == "Database error"
+        mock_session.rollback.assert_awaited_once()
+
+    async def test_execute_with_created_at(self, mock_session):
+        """Test that created_at is properly serialized."""
+        # Arrange
+        new_media = fake_media(
+            id="media_1",
+            permalink="https://instagram.com/p/test",
+            username="testuser",
+            created_at=FIXED_UTC,
+            posted_at=FIXED_DB_UTC,
+        )
+
+        # Mock services
+        mock_media_service = SimpleNamespace(get_or_create_media=AsyncReturn(new_media))
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(None))
+
+        # Create use case
+        use_case = _process_media_use_case(mock_session, mock_media_repo, media_service=mock_media_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_1")
+
+        # Assert
+        assert result.status == "success"
+        assert result.media["created_at"] == "2025-11-16T12:00:00+00:00"
+        assert result.media["posted_at"] == "2025-11-16T12:00:00"
+
+    async def test_execute_with_none_created_at(self, mock_session):
+        """Test handling when created_at is None."""
+        # Arrange
+        new_media = fake_media(
+            id="media_1",
+            permalink="https://instagram.com/p/test",
+            username="testuser",
+            created_at=None,
+            posted_at=None,
+        )
+
+        # Mock services
+        mock_media_service = SimpleNamespace(get_or_create_media=AsyncReturn(new_media))
+
+        # Mock repository
+        mock_media_repo = SimpleNamespace(get_by_id=AsyncReturn(None))
+
+        # Create use case
+        use_case = _process_media_use_case(mock_session, mock_media_repo, media_service=mock_media_service)
+
+        # Act
+        result = await use_case.execute(media_id="media_1")
+
+        # Assert
+        assert result.status == "success"
+        assert result.media["created_at"] is None
+        assert result.media["posted_at"] is None
@@ -8,59 +8,82 @@ Tests cover:
 - Exception handling
 """
 
+from datetime import datetime
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.exc import IntegrityError
+from unittest.mock import MagicMock, PropertyMock
+from sqlalchemy.exc import IntegrityError, MissingGreenlet
 
+from core.config import settings
 from core.use_cases.process_webhook_comment import ProcessWebhookCommentUseCase
-from core.models.comment_classification import ProcessingStatus
+from core.models.comment_classification import CommentClassification, ProcessingStatus
+from core.models.instagram_comment import InstagramComment
+from tests.unit.use_cases.helpers import AsyncReturn, Recorder, UNUSED
+
+# Stand-in for the Media row get_or_create_media returns in tests that never persist;
+# the use case only checks it exists.
+_FAKE_MEDIA = SimpleNamespace(id="media_1", owner="acct_1")
+
+# execute() arguments shared by most tests; each test overrides what it is about.
+_EXECUTE_DEFAULTS = dict(
+    comment_id="comment_1",
+    media_id="media_1",
+    user_id="user_123",
+    username="testuser",
+    text="Test comment",
+    entry_timestamp=1234567890,
+)
+
+# Webhook entry time and the naive UTC datetime the use case stores for it,
+# written out so the expectation does not repeat the conversion under test.
+_TIMESTAMP = 1705320000
+_TIMESTAMP_DB_UTC = datetime(2024, 1, 15, 12, 0)
+
+@pytest.fixture
+async def seeded_media(media_factory):
+    """Media row the comments persisted through db_session reference."""
+    return await media_factory(media_id=_FAKE_MEDIA.id, owner=_FAKE_MEDIA.owner)
+
+
+@pytest.fixture
+def make_use_case(mock_media_service):
+    """Build a use case over stub repositories and the shared media service mock."""
+
+    def _factory(session, *, existing=None, media=None, fetched=None):
+        mock_media_service.get_or_create_media.return_value = media
+        comment_repo = SimpleNamespace(get_by_id=AsyncReturn(existing), get_with_classification=Recorder(fetched))
 
+        use_case = ProcessWebhookCommentUseCase(
+            session=session,
+            media_service=mock_media_service,
+            task_queue=UNUSED,
+            comment_repository_factory=lambda session: comment_repo,
+            media_repository_factory=lambda session: UNUSED,
+        )
+        mocks = SimpleNamespace(media_service=mock_media_service, comment_repo=comment_repo)
+        return use_case, mocks
 
-@pytest.mark.unit
-@pytest.mark.use_case
-class TestProcessWebhookCommentUseCase:
-    """Test ProcessWebhookCommentUseCase methods."""
+    return _factory
 
-    async def test_execute_new_comment_success(self, db_session, media_factory):
-        """Test successfully creating a new comment."""
-        # Arrange
-        media = await media_factory(media_id="media_1", owner="acct_1")
-        from core.config import settings
-        original_owner = settings.instagram.base_account_id
-        settings.instagram.base_account_id = "acct_1"
 
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
+async def _run(use_case, **overrides):
+    return await use_case.execute(**{**_EXECUTE_DEFAULTS, **overrides})
 
-        mock_task_queue = MagicMock()
 
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
+class TestProcessWebhookCommentUseCase:
+    """Test ProcessWebhookCommentUseCase methods."""
 
-        mock_media_repo = MagicMock()
+    async def test_execute_new_comment_success(self, db_session, seeded_media, make_use_case, monkeypatch):
+        """Test successfully creating a new comment."""
+        # Arrange
+        monkeypatch.setattr(settings.instagram, "base_account_id", "acct_1")
 
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=mock_task_queue,
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: mock_media_repo,
-        )
+        use_case, mocks = make_use_case(db_session, media=seeded_media)
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Great product!",
-            entry_timestamp=1234567890,
-            parent_id=None,
-            raw_data={"extra": "data"},
-        )
+        result = await _run(use_case, text="Great product!", parent_id=None, raw_data={"extra": "data"})
 
         # Assert
         assert result["status"] == "created"
@@ -69,16 +92,13 @@ class TestProcessWebhookCommentUseCase:
         assert result["reason"] == "New comment created"
 
         # Verify media service called
-        mock_media_service.get_or_create_media.assert_awaited_once_with("media_1", db_session)
-        settings.instagram.base_account_id = original_owner
+        mocks.media_service.get_or_create_media.assert_awaited_once()
+        media_id, session = mocks.media_service.get_or_create_media.await_args.args
+        assert media_id == "media_1" and session is db_session
 
-    async def test_execute_existing_comment_needs_classification(
-        self, db_session
-    ):
+    async def test_execute_existing_comment_needs_classification(self, mock_session, make_use_case):
         """Test handling existing comment that needs classification."""
         # Arrange - use pure mock without database to avoid lazy loading issues
-        from core.models.instagram_comment import InstagramComment
-
         comment = InstagramComment(
             id="comment_1",
             media_id="media_1",
@@ -89,141 +109,59 @@ class TestProcessWebhookCommentUseCase:
         # Comment has no classification
         comment.classification = None
 
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=comment)
-
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=MagicMock(),
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        use_case, _ = make_use_case(mock_session, existing=comment)
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Existing comment",
-            entry_timestamp=1234567890,
-        )
+        result = await _run(use_case, text="Existing comment")
 
         # Assert
         assert result["status"] == "exists"
         assert result["comment_id"] == "comment_1"
         assert result["should_classify"] is True
 
-    async def test_execute_existing_comment_classification_completed(
-        self, db_session, comment_factory, classification_factory, media_factory
+    @pytest.mark.parametrize(
+        "status, should_classify",
+        [
+            (ProcessingStatus.COMPLETED, False),
+            (ProcessingStatus.PENDING, True),
+            (ProcessingStatus.PROCESSING, True),  # Should retry if processing
+            (ProcessingStatus.FAILED, True),  # Should retry if failed
+        ],
+        ids=["completed", "pending", "processing", "failed"],
+    )
+    async def test_execute_existing_comment_classification_status(
+        self, mock_session, make_use_case, status, should_classify
     ):
-        """Test handling existing comment with completed classification."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-        comment = await comment_factory(comment_id="comment_1", media_id=media.id)
-        classification = await classification_factory(
-            comment_id="comment_1",
-            processing_status=ProcessingStatus.COMPLETED,
-        )
-        comment.classification = classification
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=comment)
-
-        # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=MagicMock(),
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
-
-        # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
+        """Test that an existing comment is re-classified unless its classification completed."""
+        # Arrange - transient instances; the use case only reads the loaded relationship
+        comment = InstagramComment(
+            id="comment_1",
+            media_id=_FAKE_MEDIA.id,
             user_id="user_123",
             username="testuser",
             text="Existing comment",
-            entry_timestamp=1234567890,
-        )
-
-        # Assert
-        assert result["status"] == "exists"
-        assert result["comment_id"] == "comment_1"
-        assert result["should_classify"] is False
-
-    async def test_execute_existing_comment_classification_pending(
-        self, db_session, comment_factory, classification_factory
-    ):
-        """Test handling existing comment with pending classification."""
-        # Arrange
-        comment = await comment_factory(comment_id="comment_1")
-        comment.classification = await classification_factory(
-            comment_id="comment_1",
-            processing_status=ProcessingStatus.PENDING,
         )
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=comment)
+        comment.classification = CommentClassification(comment_id="comment_1", processing_status=status)
 
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=MagicMock(),
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        use_case, _ = make_use_case(mock_session, existing=comment)
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Existing comment",
-            entry_timestamp=1234567890,
-        )
+        result = await _run(use_case, text="Existing comment")
 
         # Assert
         assert result["status"] == "exists"
-        assert result["should_classify"] is True
+        assert result["comment_id"] == "comment_1"
+        assert result["should_classify"] is should_classify
 
-    async def test_execute_media_creation_failure(self, db_session):
+    async def test_execute_media_creation_failure(self, mock_session, make_use_case):
         """Test handling when media creation fails."""
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=None)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        use_case, _ = make_use_case(mock_session)
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_missing",
-            user_id="user_123",
-            username="testuser",
-            text="Comment text",
-            entry_timestamp=1234567890,
-        )
+        result = await _run(use_case, media_id="media_missing", text="Comment text")
 
         # Assert
         assert result["status"] == "error"
@@ -231,71 +169,36 @@ class TestProcessWebhookCommentUseCase:
         assert result["should_classify"] is False
         assert "failed to create media" in result["reason"].lower()
 
-    async def test_execute_account_mismatch_entry_id(self, db_session, media_factory):
+    async def test_execute_account_mismatch_entry_id(self, mock_session, make_use_case, monkeypatch):
         """Webhook entry account mismatch should block processing."""
-        media = await media_factory(media_id="media_1")
-        from core.config import settings
-        original_owner = settings.instagram.base_account_id
-        settings.instagram.base_account_id = "expected_owner"
+        monkeypatch.setattr(settings.instagram, "base_account_id", "expected_owner")
 
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
+        use_case, _ = make_use_case(mock_session, media=_FAKE_MEDIA)
 
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
-
-        result = await use_case.execute(
+        result = await _run(
+            use_case,
             comment_id="comment_forbidden",
-            media_id="media_1",
-            user_id="user_123",
             username="tester",
             text="Should be rejected",
-            entry_timestamp=1234567890,
             entry_owner_id="other_owner",
         )
 
         assert result["status"] == "forbidden"
         assert result["should_classify"] is False
         assert result["reason"] == "Invalid webhook account"
-        settings.instagram.base_account_id = original_owner
 
-    async def test_execute_with_parent_comment(self, db_session, media_factory):
+    async def test_execute_with_parent_comment(self, db_session, seeded_media, make_use_case):
         """Test creating comment with parent_id (reply to another comment)."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        use_case, _ = make_use_case(db_session, media=seeded_media)
 
         # Act
-        result = await use_case.execute(
+        result = await _run(
+            use_case,
             comment_id="reply_1",
-            media_id="media_1",
             user_id="user_456",
             username="replier",
             text="Replying to parent comment",
-            entry_timestamp=1234567890,
             parent_id="parent_comment_123",
         )
 
@@ -303,118 +206,34 @@ class TestProcessWebhookCommentUseCase:
         assert result["status"] == "created"
         assert result["should_classify"] is True
 
-    async def test_execute_integrity_error_race_condition(
-        self, db_session, media_factory
-    ):
-        """Test handling IntegrityError (race condition)."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
-        # Create use case with mocked session that raises IntegrityError
-        from unittest.mock import PropertyMock
-        mock_session = MagicMock()
-        mock_session.add = MagicMock()
-        mock_session.commit = AsyncMock(side_effect=IntegrityError(None, None, None))
-        mock_session.rollback = AsyncMock()
-
-        use_case = ProcessWebhookCommentUseCase(
-            session=mock_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+    @pytest.mark.parametrize(
+        "commit_error, status, reason",
+        [
+            (IntegrityError(None, None, None), "exists", "Race condition - inserted by another process"),
+            (Exception("Database connection lost"), "error", "Unexpected error: Database connection lost"),
+        ],
+        ids=["integrity_error_race_condition", "generic_exception"],
+    )
+    async def test_execute_db_commit_failure(self, mock_session, make_use_case, commit_error, status, reason):
+        """Test that a failed commit is rolled back and reported without classification."""
+        # Create use case with mocked session whose commit fails
+        use_case, _ = make_use_case(mock_session, media=_FAKE_MEDIA)
+        mock_session.commit.side_effect = commit_error
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_race",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Race condition comment",
-            entry_timestamp=1234567890,
-        )
+        result = await _run(use_case, comment_id="comment_db_error", text="DB error comment")
 
         # Assert
-        assert result["status"] == "exists"
-        assert result["comment_id"] == "comment_race"
-        assert result["should_classify"] is False
-        assert "race condition" in result["reason"].lower()
-        mock_session.rollback.assert_awaited_once()
-
-    async def test_execute_unexpected_exception(self, db_session, media_factory):
-        """Test handling unexpected exceptions."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
-        # Create use case with mocked session that raises unexpected exception
-        mock_session = MagicMock()
-        mock_session.add = MagicMock()
-        mock_session.commit = AsyncMock(side_effect=Exception("Database connection lost"))
-        mock_session.rollback = AsyncMock()
-
-        use_case = ProcessWebhookCommentUseCase(
-            session=mock_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
-
-        # Act
-        result = await use_case.execute(
-            comment_id="comment_error",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Error comment",
-            entry_timestamp=1234567890,
-        )
-
-        # Assert
-        assert result["status"] == "error"
-        assert result["comment_id"] == "comment_error"
+        assert result["status"] == status
+        assert result["comment_id"] == "comment_db_error"
         assert result["should_classify"] is False
-        assert "unexpected error" in result["reason"].lower()
+        assert result["reason"] == reason
         mock_session.rollback.assert_awaited_once()
 
-    async def test_execute_with_raw_data(self, db_session, media_factory):
+    async def test_execute_with_raw_data(self, db_session, seeded_media, make_use_case):
         """Test creating comment with raw_data."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        use_case, _ = make_use_case(db_session, media=seeded_media)
 
         raw_webhook_data = {
             "field": "comments",
@@ -426,125 +245,44 @@ class TestProcessWebhookCommentUseCase:
         }
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Test comment",
-            entry_timestamp=1234567890,
-            raw_data=raw_webhook_data,
-        )
+        result = await _run(use_case, raw_data=raw_webhook_data)
 
         # Assert
         assert result["status"] == "created"
         assert result["should_classify"] is True
 
-    async def test_execute_without_raw_data(self, db_session, media_factory):
+    async def test_execute_without_raw_data(self, db_session, seeded_media, make_use_case):
         """Test creating comment without raw_data (defaults to empty dict)."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        use_case, _ = make_use_case(db_session, media=seeded_media)
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Test comment",
-            entry_timestamp=1234567890,
-            raw_data=None,  # No raw data
-        )
+        result = await _run(use_case, raw_data=None)  # No raw data
 
         # Assert
         assert result["status"] == "created"
 
-    async def test_execute_timestamp_conversion(self, db_session, media_factory):
+    async def test_execute_timestamp_conversion(self, mock_session, make_use_case):
         """Test that entry_timestamp is correctly converted to datetime."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        use_case, _ = make_use_case(mock_session, media=_FAKE_MEDIA)
 
         # Act
-        timestamp = 1705320000  # 2024-01-15 10:00:00 UTC
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Test comment",
-            entry_timestamp=timestamp,
-        )
+        result = await _run(use_case, entry_timestamp=_TIMESTAMP)
 
         # Assert
         assert result["status"] == "created"
+        (comment,) = mock_session.add.call_args.args
+        assert comment.created_at == _TIMESTAMP_DB_UTC
 
-    async def test_execute_media_service_exception(self, db_session):
+    async def test_execute_media_service_exception(self, mock_session, make_use_case):
         """Test handling when media service raises an exception."""
-        # Mock services - media service throws exception
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(
-            side_effect=Exception("Instagram API timeout")
-        )
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
-        mock_session = MagicMock()
-        mock_session.rollback = AsyncMock()
-
-        # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=mock_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
+        # Create use case with a media service that raises
+        use_case, mocks = make_use_case(mock_session)
+        mocks.media_service.get_or_create_media.side_effect = Exception("Instagram API timeout")
 
         # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_error",
-            user_id="user_123",
-            username="testuser",
-            text="Comment text",
-            entry_timestamp=1234567890,
-        )
+        result = await _run(use_case, media_id="media_error", text="Comment text")
 
         # Assert
         assert result["status"] == "error"
@@ -553,193 +291,37 @@ class TestProcessWebhookCommentUseCase:
         assert "unexpected error" in result["reason"].lower()
         mock_session.rollback.assert_awaited_once()
 
-    async def test_execute_existing_comment_classification_processing(
-        self, db_session, comment_factory, classification_factory
-    ):
-        """Test handling existing comment with classification in PROCESSING status."""
-        # Arrange
-        comment = await comment_factory(comment_id="comment_1")
-        comment.classification = await classification_factory(
-            comment_id="comment_1",
-            processing_status=ProcessingStatus.PROCESSING,
-        )
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=comment)
-
-        # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=MagicMock(),
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
-
-        # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Existing comment",
-            entry_timestamp=1234567890,
-        )
-
-        # Assert
-        assert result["status"] == "exists"
-        assert result["should_classify"] is True  # Should retry if processing
-
-    async def test_execute_existing_comment_classification_failed(
-        self, db_session, comment_factory, classification_factory
-    ):
-        """Test handling existing comment with FAILED classification status."""
-        # Arrange
-        comment = await comment_factory(comment_id="comment_1")
-        comment.classification = await classification_factory(
-            comment_id="comment_1",
-            processing_status=ProcessingStatus.FAILED,
-        )
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=comment)
-
-        # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=MagicMock(),
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
-
-        # Act
-        result = await use_case.execute(
-            comment_id="comment_1",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Existing comment",
-            entry_timestamp=1234567890,
-        )
-
-        # Assert
-        assert result["status"] == "exists"
-        assert result["should_classify"] is True  # Should retry if failed
-
-    async def test_execute_db_commit_generic_exception(self, db_session, media_factory):
-        """Test handling when database commit raises a non-IntegrityError exception."""
-        # Arrange
-        media = await media_factory(media_id="media_1")
-
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=None)
-
-        # Create use case with mocked session that raises generic exception
-        mock_session = MagicMock()
-        mock_session.add = MagicMock()
-        mock_session.commit = AsyncMock(
-            side_effect=Exception("Database connection lost")
-        )
-        mock_session.rollback = AsyncMock()
-
-        use_case = ProcessWebhookCommentUseCase(
-            session=mock_session,
-            media_service=mock_media_service,
-            task_queue=MagicMock(),
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: MagicMock(),
-        )
-
-        # Act
-        result = await use_case.execute(
-            comment_id="comment_db_error",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="DB error comment",
-            entry_timestamp=1234567890,
-        )
-
-        # Assert
-        assert result["status"] == "error"
-        assert result["comment_id"] == "comment_db_error"
-        assert result["should_classify"] is False
-        assert "unexpected error" in result["reason"].lower()
-        mock_session.rollback.assert_awaited_once()
-
-    async def test_execute_existing_comment_lazy_load_error(self, db_session, comment_factory, media_factory):
+    async def test_execute_existing_comment_lazy_load_error(self, mock_session, make_use_case):
         """Test MissingGreenlet exception when accessing classification relationship."""
-        from sqlalchemy.exc import MissingGreenlet
-        from core.models.comment_classification import CommentClassification
-        
         # Arrange
-        media = await media_factory(media_id="media_1", owner="acct_1")
-        comment = await comment_factory(comment_id="comment_existing", media_id=media.id)
-        
         # Create classification for the comment
         existing_classification = CommentClassification(
             comment_id="comment_existing",
             processing_status=ProcessingStatus.COMPLETED
         )
         
-        # Mock services
-        mock_media_service = MagicMock()
-        mock_media_service.get_or_create_media = AsyncMock(return_value=media)
-        
-        mock_task_queue = MagicMock()
-        
         # Mock comment that raises MissingGreenlet when accessing classification
         mock_existing_comment = MagicMock()
         mock_existing_comment.id = "comment_existing"
         mock_existing_comment.media_id = "media_1"
         
         # When accessing .classification, raise MissingGreenlet
-        def raise_missing_greenlet():
-            raise MissingGreenlet("greenlet_error")
-        
-        type(mock_existing_comment).classification = property(lambda self: raise_missing_greenlet())
+        type(mock_existing_comment).classification = PropertyMock(side_effect=MissingGreenlet("greenlet_error"))
         
         # Mock the fetched comment with classification loaded
-        mock_fetched_comment = MagicMock()
-        mock_fetched_comment.classification = existing_classification
-        
-        # Mock repositories
-        mock_comment_repo = MagicMock()
-        mock_comment_repo.get_by_id = AsyncMock(return_value=mock_existing_comment)
-        mock_comment_repo.get_with_classification = AsyncMock(return_value=mock_fetched_comment)
-        
-        mock_media_repo = MagicMock()
+        mock_fetched_comment = SimpleNamespace(classification=existing_classification)
         
         # Create use case
-        use_case = ProcessWebhookCommentUseCase(
-            session=db_session,
-            media_service=mock_media_service,
-            task_queue=mock_task_queue,
-            comment_repository_factory=lambda session: mock_comment_repo,
-            media_repository_factory=lambda session: mock_media_repo,
+        use_case, mocks = make_use_case(
+            mock_session, existing=mock_existing_comment, media=_FAKE_MEDIA, fetched=mock_fetched_comment
         )
         
         # Act
-        result = await use_case.execute(
-            comment_id="comment_existing",
-            media_id="media_1",
-            user_id="user_123",
-            username="testuser",
-            text="Test comment",
-            entry_timestamp=1234567890,
-        )
+        result = await _run(use_case, comment_id="comment_existing")
         
         # Assert
         assert result["status"] == "exists"
         assert result["comment_id"] == "comment_existing"
         assert result["should_classify"] is False  # Classification is completed
         # Verify fallback to get_with_classification was called
-        mock_comment_repo.get_with_classification.assert_awaited_once_with("comment_existing")
+        assert mocks.comment_repo.get_with_classification.calls == [(("comment_existing",), {})]
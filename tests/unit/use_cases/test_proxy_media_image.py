@@ -1,15 +1,24 @@
+from collections import deque
+from types import SimpleNamespace
+
 import pytest
 
 from core.use_cases.proxy_media_image import ProxyMediaImageUseCase, MediaImageProxyError
 
+_ALLOWED_HOST_SUFFIXES = ("cdninstagram.com",)
+
 
 class FakeMedia:
+    __slots__ = ("media_url", "children_media_urls")
+
     def __init__(self, media_url=None, children_media_urls=None):
         self.media_url = media_url
         self.children_media_urls = children_media_urls
 
 
 class FakeMediaRepository:
+    __slots__ = ("_media_by_id", "requested_ids")
+
     def __init__(self, media_by_id):
         self._media_by_id = media_by_id
         self.requested_ids = []
@@ -19,7 +28,27 @@ class FakeMediaRepository:
         return self._media_by_id.get(media_id)
 
 
+class _ChunkIter:
+    __slots__ = ("_chunks", "_index")
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._index = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._index >= len(self._chunks):
+            raise StopAsyncIteration
+        chunk = self._chunks[self._index]
+        self._index += 1
+        return chunk
+
+
 class FakeFetchResult:
+    __slots__ = ("status", "content_type", "cache_control", "_chunks", "closed")
+
     def __init__(self, status=200, content_type="image/jpeg", cache_control=None, chunks=None):
         self.status = status
         self.content_type = content_type
@@ -28,21 +57,20 @@ class FakeFetchResult:
         self.closed = False
 
     def iter_bytes(self):
-        async def generator():
-            for chunk in self._chunks:
-                yield chunk
-            # Simulate close responsibility on consumer
-        return generator()
+        # Closing stays the consumer's responsibility
+        return _ChunkIter(self._chunks)
 
     async def close(self):
         self.closed = True
 
 
 class FakeMediaProxyService:
+    __slots__ = ("_fetch_result", "_error", "_sequence", "requested_urls")
+
     def __init__(self, fetch_result=None, error=None, sequence=None):
         self._fetch_result = fetch_result
         self._error = error
-        self._sequence = list(sequence) if sequence is not None else None
+        self._sequence = deque(sequence) if sequence is not None else None
         self.requested_urls = []
 
     async def fetch_image(self, url: str):
@@ -50,13 +78,16 @@ class FakeMediaProxyService:
         if self._error:
             raise self._error
         if self._sequence is not None and self._sequence:
-            return self._sequence.pop(0)
+            return self._sequence.popleft()
         return self._fetch_result
 
 
 class FakeMediaService:
+    __slots__ = ("_media_by_id", "refreshed_media", "calls")
+
     def __init__(self, repository: FakeMediaRepository, refreshed_media=None):
-        self.repository = repository
+        # Refreshes write straight into the repository's backing dict
+        self._media_by_id = repository._media_by_id
         self.refreshed_media = refreshed_media
         self.calls = []
 
@@ -64,265 +95,168 @@ class FakeMediaService:
         self.calls.append(media_id)
         if self.refreshed_media is None:
             return None
-        self.repository._media_by_id[media_id] = self.refreshed_media
+        self._media_by_id[media_id] = self.refreshed_media
         return self.refreshed_media
 
 
 def repo_factory_builder(repository):
     def factory(*, session):
         return repository
+
     return factory
 
 
+@pytest.fixture
+def make_use_case():
+    """Build a use case over fresh fakes serving ``media`` as "media1", returning both."""
+
+    def _build(media=None, *, fetch_result=None, error=None, sequence=None, refreshed=None):
+        repository = FakeMediaRepository(media_by_id={"media1": media} if media is not None else {})
+        proxy_service = FakeMediaProxyService(fetch_result=fetch_result, error=error, sequence=sequence)
+        media_service = FakeMediaService(repository, refreshed_media=refreshed)
+
+        use_case = ProxyMediaImageUseCase(
+            session=None,
+            media_repository_factory=repo_factory_builder(repository),
+            proxy_service=proxy_service,
+            media_service=media_service,
+            allowed_host_suffixes=_ALLOWED_HOST_SUFFIXES,
+        )
+        return use_case, SimpleNamespace(proxy=proxy_service, media_service=media_service)
+
+    return _build
+
+
 @pytest.mark.asyncio
-async def test_proxy_media_image_success():
+async def test_proxy_media_image_success(make_use_case):
     media = FakeMedia(media_url="https://cdninstagram.com/image.jpg")
-    repository = FakeMediaRepository(media_by_id={"media1": media})
     fetch_result = FakeFetchResult(chunks=[b"a", b"b"], cache_control="public")
-    proxy_service = FakeMediaProxyService(fetch_result=fetch_result)
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
+    use_case, fakes = make_use_case(media, fetch_result=fetch_result)
 
     result = await use_case.execute("media1")
 
     assert result.media_url == "https://cdninstagram.com/image.jpg"
     assert result.fetch_result is fetch_result
-    assert proxy_service.requested_urls == ["https://cdninstagram.com/image.jpg"]
+    assert [chunk async for chunk in result.fetch_result.iter_bytes()] == [b"a", b"b"]
+    assert fakes.proxy.requested_urls == ["https://cdninstagram.com/image.jpg"]
     assert fetch_result.closed is False
 
 
-@pytest.mark.asyncio
-async def test_proxy_media_image_child_index():
-    media = FakeMedia(children_media_urls=["https://cdninstagram.com/child.jpg"])
-    repository = FakeMediaRepository(media_by_id={"media1": media})
-    fetch_result = FakeFetchResult()
-    proxy_service = FakeMediaProxyService(fetch_result=fetch_result)
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
-
-    result = await use_case.execute("media1", child_index=0)
-    assert proxy_service.requested_urls == ["https://cdninstagram.com/child.jpg"]
-    assert result.media_url == "https://cdninstagram.com/child.jpg"
-
-
-@pytest.mark.asyncio
-async def test_proxy_media_image_second_child_index():
-    media = FakeMedia(
-        children_media_urls=[
-            "https://cdninstagram.com/child0.jpg",
-            "https://cdninstagram.com/child1.jpg",
-        ]
-    )
-    repository = FakeMediaRepository(media_by_id={"media1": media})
-    fetch_result = FakeFetchResult()
-    proxy_service = FakeMediaProxyService(fetch_result=fetch_result)
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
-
-    result = await use_case.execute("media1", child_index=1)
-    assert proxy_service.requested_urls == ["https://cdninstagram.com/child1.jpg"]
-    assert result.media_url == "https://cdninstagram.com/child1.jpg"
+_CHILD_URLS = ["https://cdninstagram.com/child0.jpg", "https://cdninstagram.com/child1.jpg"]
 
 
 @pytest.mark.asyncio
-async def test_proxy_media_image_media_not_found():
-    repository = FakeMediaRepository(media_by_id={})
-    proxy_service = FakeMediaProxyService(fetch_result=FakeFetchResult())
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
+@pytest.mark.parametrize("child_index, expected_url", list(enumerate(_CHILD_URLS)), ids=["first", "second"])
+async def test_proxy_media_image_child_index(make_use_case, child_index, expected_url):
+    media = FakeMedia(children_media_urls=_CHILD_URLS)
+    use_case, fakes = make_use_case(media, fetch_result=FakeFetchResult())
 
-    with pytest.raises(MediaImageProxyError) as exc:
-        await use_case.execute("missing")
-
-    assert exc.value.status_code == 404
-    assert exc.value.code == 4040
+    result = await use_case.execute("media1", child_index=child_index)
+    assert fakes.proxy.requested_urls == [expected_url]
+    assert result.media_url == expected_url
 
 
 @pytest.mark.asyncio
-async def test_proxy_media_image_invalid_child_index():
-    media = FakeMedia(children_media_urls=["https://cdninstagram.com/child.jpg"])
-    repository = FakeMediaRepository(media_by_id={"media1": media})
-    proxy_service = FakeMediaProxyService(fetch_result=FakeFetchResult())
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
+@pytest.mark.parametrize(
+    "media_id, media, child_index, proxy_kwargs, status_code, code",
+    [
+        pytest.param(
+            "media1",
+            FakeMedia(media_url="ftp://cdninstagram.com/image.jpg"),
+            None,
+            {},
+            400,
+            4003,
+            id="invalid-scheme",
+        ),
+        pytest.param(
+            "media1",
+            FakeMedia(media_url="https://example.com/image.jpg"),
+            None,
+            {},
+            400,
+            4004,
+            id="host-not-allowed",
+        ),
+        pytest.param("missing", None, None, {}, 404, 4040, id="media-not-found"),
+        pytest.param(
+            "media1",
+            FakeMedia(children_media_urls=["https://cdninstagram.com/child.jpg"]),
+            2,
+            {},
+            404,
+            4043,
+            id="invalid-child-index",
+        ),
+        pytest.param(
+            "media1",
+            FakeMedia(media_url="https://cdninstagram.com/image.jpg"),
+            None,
+            {"error": lambda: RuntimeError("boom")},
+            502,
+            5005,
+            id="fetch-service-error",
+        ),
+        pytest.param(
+            "media1",
+            FakeMedia(media_url="https://cdninstagram.com/image.jpg"),
+            None,
+            {"fetch_result": lambda: FakeFetchResult(status=404)},
+            502,
+            5003,
+            id="non-success-status",
+        ),
+    ],
+)
+async def test_proxy_media_image_error_paths(
+    make_use_case, media_id, media, child_index, proxy_kwargs, status_code, code
+):
+    # Rows hold factories so every run gets fresh fakes
+    proxy_kwargs = {name: make() for name, make in proxy_kwargs.items()}
+    use_case, _ = make_use_case(media, **proxy_kwargs)
 
     with pytest.raises(MediaImageProxyError) as exc:
-        await use_case.execute("media1", child_index=2)
+        await use_case.execute(media_id, child_index=child_index)
 
-    assert exc.value.code == 4043
+    assert exc.value.status_code == status_code
+    assert exc.value.code == code
+    # A fetched response that is not returned to the caller must be closed
+    fetch_result = proxy_kwargs.get("fetch_result")
+    if fetch_result is not None:
+        assert fetch_result.closed is True
 
 
 @pytest.mark.asyncio
-async def test_proxy_media_image_invalid_scheme():
-    media = FakeMedia(media_url="ftp://cdninstagram.com/image.jpg")
-    repository = FakeMediaRepository(media_by_id={"media1": media})
-    proxy_service = FakeMediaProxyService(fetch_result=FakeFetchResult())
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
-
-    with pytest.raises(MediaImageProxyError) as exc:
-        await use_case.execute("media1")
-
-    assert exc.value.code == 4003
-
-
-@pytest.mark.asyncio
-async def test_proxy_media_image_host_not_allowed():
-    media = FakeMedia(media_url="https://example.com/image.jpg")
-    repository = FakeMediaRepository(media_by_id={"media1": media})
-    proxy_service = FakeMediaProxyService(fetch_result=FakeFetchResult())
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
-
-    with pytest.raises(MediaImageProxyError) as exc:
-        await use_case.execute("media1")
-
-    assert exc.value.code == 4004
-
-
-@pytest.mark.asyncio
-async def test_proxy_media_image_fetch_service_error():
-    media = FakeMedia(media_url="https://cdninstagram.com/image.jpg")
-    repository = FakeMediaRepository(media_by_id={"media1": media})
-    proxy_service = FakeMediaProxyService(error=RuntimeError("boom"))
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
-
-    with pytest.raises(MediaImageProxyError) as exc:
-        await use_case.execute("media1")
-
-    assert exc.value.code == 5005
-
-
-@pytest.mark.asyncio
-async def test_proxy_media_image_non_success_status():
-    media = FakeMedia(media_url="https://cdninstagram.com/image.jpg")
-    repository = FakeMediaRepository(media_by_id={"media1": media})
-    fetch_result = FakeFetchResult(status=404)
-    proxy_service = FakeMediaProxyService(fetch_result=fetch_result)
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
-
-    with pytest.raises(MediaImageProxyError) as exc:
-        await use_case.execute("media1")
-
-    assert fetch_result.closed is True
-    assert exc.value.code == 5003
-
-
-@pytest.mark.asyncio
-async def test_proxy_media_image_refresh_on_expired_url():
+async def test_proxy_media_image_refresh_on_expired_url(make_use_case):
     original = FakeMedia(media_url="https://cdninstagram.com/expired.jpg")
     refreshed = FakeMedia(media_url="https://cdninstagram.com/new.jpg")
-    repository = FakeMediaRepository(media_by_id={"media1": original})
-
-    proxy_service = FakeMediaProxyService(
-        sequence=[FakeFetchResult(status=403), FakeFetchResult(status=200)]
-    )
-    media_service = FakeMediaService(repository, refreshed_media=refreshed)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
+    use_case, fakes = make_use_case(
+        original,
+        sequence=[FakeFetchResult(status=403), FakeFetchResult(status=200)],
+        refreshed=refreshed,
     )
 
     result = await use_case.execute("media1")
     assert result.media_url == "https://cdninstagram.com/new.jpg"
 
-    assert media_service.calls == ["media1", "media1"]
-    assert proxy_service.requested_urls == [
+    assert fakes.media_service.calls == ["media1", "media1"]
+    assert fakes.proxy.requested_urls == [
         "https://cdninstagram.com/new.jpg",
         "https://cdninstagram.com/new.jpg",
     ]
 
 
 @pytest.mark.asyncio
-async def test_proxy_media_image_refresh_failure():
+async def test_proxy_media_image_refresh_failure(make_use_case):
     original = FakeMedia(media_url="https://cdninstagram.com/expired.jpg")
-    repository = FakeMediaRepository(media_by_id={"media1": original})
-
-    proxy_service = FakeMediaProxyService(
+    use_case, fakes = make_use_case(
+        original,
         fetch_result=FakeFetchResult(status=403),
         sequence=[FakeFetchResult(status=403)],
     )
-    media_service = FakeMediaService(repository, refreshed_media=None)
-
-    use_case = ProxyMediaImageUseCase(
-        session=None,
-        media_repository_factory=repo_factory_builder(repository),
-        proxy_service=proxy_service,
-        media_service=media_service,
-        allowed_host_suffixes=["cdninstagram.com"],
-    )
 
     with pytest.raises(MediaImageProxyError) as exc:
         await use_case.execute("media1")
 
     assert exc.value.code == 5003
-    assert media_service.calls == ["media1", "media1"]
+    assert fakes.media_service.calls == ["media1", "media1"]
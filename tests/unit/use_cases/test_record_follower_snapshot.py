@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date
 
 import pytest
@@ -10,21 +11,24 @@ from core.use_cases.record_follower_snapshot import (
 )
 
 
+@dataclass(slots=True)
+class SnapshotRecord:
+    followers_count: int
+    follows_count: int | None = None
+    media_count: int | None = None
+
+
 class FakeFollowersRepo:
     def __init__(self):
         self.saved = []
 
     async def upsert_snapshot(self, **kwargs):
         self.saved.append(kwargs)
-        return type(
-            "Record",
-            (),
-            {
-                "followers_count": kwargs["followers_count"],
-                "follows_count": kwargs.get("follows_count"),
-                "media_count": kwargs.get("media_count"),
-            },
-        )()
+        return SnapshotRecord(
+            followers_count=kwargs["followers_count"],
+            follows_count=kwargs.get("follows_count"),
+            media_count=kwargs.get("media_count"),
+        )
 
 
 class FakeInstagramService:
@@ -46,11 +50,11 @@ class FakeInstagramService:
 
 
 @pytest.mark.asyncio
-async def test_record_follower_snapshot_success(db_session):
+async def test_record_follower_snapshot_success(mock_session):
     repo = FakeFollowersRepo()
     service = FakeInstagramService()
     use_case = RecordFollowerSnapshotUseCase(
-        session=db_session,
+        session=mock_session,
         instagram_service=service,
         followers_dynamic_repository_factory=lambda session: repo,
     )
@@ -59,17 +63,21 @@ async def test_record_follower_snapshot_success(db_session):
 
     assert result["followers_count"] == 123
     assert repo.saved[0]["snapshot_date"] == date(2025, 11, 17)
+    mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_record_follower_snapshot_failure(db_session):
+async def test_record_follower_snapshot_failure(mock_session):
     repo = FakeFollowersRepo()
     service = FakeInstagramService(success=False)
     use_case = RecordFollowerSnapshotUseCase(
-        session=db_session,
+        session=mock_session,
         instagram_service=service,
         followers_dynamic_repository_factory=lambda session: repo,
     )
 
     with pytest.raises(FollowersSnapshotError):
         await use_case.execute(snapshot_date=date(2025, 11, 17))
+
+    assert repo.saved == []
+    mock_session.commit.assert_not_awaited()
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models import CommentClassification, InstagramComment, Media, QuestionAnswer
 from core.models.comment_classification import ProcessingStatus
@@ -30,24 +30,39 @@ class StubInstagramService:
         return {"success": True, "reply_id": reply_id, "response": payload}
 
 
+def _answer_repository_factory(session):
+    return AnswerRepository(session)
+
+
+def _savepoint_session(bind):
+    """Session on the test's connection whose commits only release a SAVEPOINT."""
+    return AsyncSession(bind=bind, expire_on_commit=False, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture
+async def seeded_media(db_session):
+    """One Media row on the test's connection for the comments under test to hang off."""
+    media = Media(
+        id="media_seed",
+        permalink="https://instagram.com/p/media_seed",
+        media_type="IMAGE",
+        media_url="https://cdn.test/media_seed.jpg",
+        created_at=now_db_utc(),
+        updated_at=now_db_utc(),
+    )
+    db_session.add(media)
+    await db_session.flush()
+    return media
+
+
 @pytest.mark.asyncio
-async def test_replace_answer_success(db_session):
+async def test_replace_answer_success(db_session, seeded_media):
     instagram = StubInstagramService()
-    session_factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
-
-    async with session_factory() as session:
-        media = Media(
-            id="media_replace",
-            permalink="https://instagram.com/p/media_replace",
-            media_type="IMAGE",
-            media_url="https://cdn.test/media_replace.jpg",
-            created_at=now_db_utc(),
-            updated_at=now_db_utc(),
-        )
-        session.add(media)
+
+    async with _savepoint_session(db_session.bind) as session:
         comment = InstagramComment(
             id="comment_replace",
-            media_id=media.id,
+            media_id=seeded_media.id,
             user_id="user",
             username="tester",
             text="Original question",
@@ -79,11 +94,12 @@ async def test_replace_answer_success(db_session):
         session.add(answer)
         await session.commit()
         answer_id = answer.id
+        # Make the use case load the answer from the database, not the identity map
+        session.expire_all()
 
-    async with session_factory() as session:
         use_case = ReplaceAnswerUseCase(
             session=session,
-            answer_repository_factory=lambda session=None, **_: AnswerRepository(session),
+            answer_repository_factory=_answer_repository_factory,
             instagram_service=instagram,
         )
 
@@ -102,37 +118,27 @@ async def test_replace_answer_success(db_session):
         assert new_answer.processing_started_at is None
         assert new_answer.processing_completed_at is None
 
-    assert instagram.deleted == ["reply-original"]
-    assert instagram.sent[-1]["message"] == "Manual override reply"
+        assert instagram.deleted == ["reply-original"]
+        assert instagram.sent[-1]["message"] == "Manual override reply"
 
-    async with session_factory() as session:
-        original = await session.get(QuestionAnswer, answer_id)
-        assert original.is_deleted is True
-        assert original.reply_status == "deleted"
-        assert original.reply_sent_at == original_sent_at
-        assert original.processing_started_at == original_started
-        assert original.processing_completed_at == original_completed
+        # Re-read the replaced answer from the database
+        await session.refresh(answer)
+        assert answer.is_deleted is True
+        assert answer.reply_status == "deleted"
+        assert answer.reply_sent_at == original_sent_at
+        assert answer.processing_started_at == original_started
+        assert answer.processing_completed_at == original_completed
 
 
 @pytest.mark.asyncio
-async def test_replace_answer_delete_failure_raises(db_session):
+async def test_replace_answer_delete_failure_raises(db_session, seeded_media):
     instagram = StubInstagramService()
     instagram.fail_delete = True
-    session_factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
-
-    async with session_factory() as session:
-        media = Media(
-            id="media_replace_fail",
-            permalink="https://instagram.com/p/media_replace_fail",
-            media_type="IMAGE",
-            media_url="https://cdn.test/media_replace_fail.jpg",
-            created_at=now_db_utc(),
-            updated_at=now_db_utc(),
-        )
-        session.add(media)
+
+    async with _savepoint_session(db_session.bind) as session:
         comment = InstagramComment(
             id="comment_replace_fail",
-            media_id=media.id,
+            media_id=seeded_media.id,
             user_id="user",
             username="tester",
             text="Original question",
@@ -150,11 +156,12 @@ async def test_replace_answer_delete_failure_raises(db_session):
         session.add(answer)
         await session.commit()
         answer_id = answer.id
+        # Make the use case load the answer from the database, not the identity map
+        session.expire_all()
 
-    async with session_factory() as session:
         use_case = ReplaceAnswerUseCase(
             session=session,
-            answer_repository_factory=lambda session=None, **_: AnswerRepository(session),
+            answer_repository_factory=_answer_repository_factory,
             instagram_service=instagram,
         )
 
@@ -165,8 +172,8 @@ async def test_replace_answer_delete_failure_raises(db_session):
                 quality_score=80,
             )
 
-    # Verify original answer unchanged in DB
-    async with session_factory() as session:
+        # Verify original answer unchanged in DB
+        session.expire_all()
         original = await session.get(QuestionAnswer, answer_id)
         assert original.is_deleted is False
         assert original.reply_status == "sent"